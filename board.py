@@ -1,10 +1,3 @@
-from word_validator import WordValidator
-from scoring import Scoring
-
-from scoring import Scoring
-
-from letter_bank import LetterBank
-
 class Board:
     """
     Represents the game board for Word Mosaic
@@ -139,7 +132,9 @@ class Board:
         
     def reset(self):
         """Reset the board to initial state"""
-        self.board = [['0' for _ in range(self.cols)] for _ in range(self.rows)]
+        # Rows are cleared in place so the existing lists are reused
+        for row in self.board:
+            row[:] = ['0'] * self.cols
         
     def get_all_words(self):
         """
@@ -152,42 +147,68 @@ class Board:
         
         # Check horizontal words
         for row in range(self.rows):
-            word = ""
-            positions = []
-            for col in range(self.cols):
-                letter = self.get_letter(row, col)
-                if letter != '0':
-                    word += letter
-                    positions.append((row, col))
-                else:
-                    if len(word) > 1:  # Only consider words of 2 or more letters
-                        words.append((word, positions[:]))
-                    word = ""
-                    positions = []
-            
-            # Check if there's a word at the end of the row
-            if len(word) > 1:
-                words.append((word, positions))
+            words.extend(self._words_in_line([(row, col) for col in range(self.cols)]))
         
         # Check vertical words
         for col in range(self.cols):
-            word = ""
-            positions = []
-            for row in range(self.rows):
-                letter = self.get_letter(row, col)
-                if letter != '0':
-                    word += letter
-                    positions.append((row, col))
-                else:
-                    if len(word) > 1:  # Only consider words of 2 or more letters
-                        words.append((word, positions[:]))
-                    word = ""
-                    positions = []
+            words.extend(self._words_in_line([(row, col) for row in range(self.rows)]))
+                
+        return words
+        
+    def get_words_through(self, positions):
+        """
+        Get the words that pass through any of the given positions
+        
+        Only the rows and columns containing the positions are scanned.
+        
+        Args:
+            positions (iterable): (row, col) tuples the words must include
             
-            # Check if there's a word at the end of the column
-            if len(word) > 1:
-                words.append((word, positions))
+        Returns:
+            list: List of tuples (word, positions) where positions is a list of (row, col)
+        """
+        targets = set(positions)
+        words = []
+        
+        # Check horizontal words
+        for row in sorted({r for r, _ in targets}):
+            words.extend(self._words_in_line([(row, col) for col in range(self.cols)], targets))
+            
+        # Check vertical words
+        for col in sorted({c for _, c in targets}):
+            words.extend(self._words_in_line([(row, col) for row in range(self.rows)], targets))
+            
+        return words
+        
+    def _words_in_line(self, line, targets=None):
+        """
+        Collect the words along a single row or column
+        
+        Args:
+            line (list): (row, col) tuples of the row or column in order
+            targets (set, optional): If given, only keep words including one of these positions
+            
+        Returns:
+            list: List of tuples (word, positions)
+        """
+        words = []
+        letters = []
+        positions = []
+        
+        # A trailing None flushes a word that runs to the edge of the board
+        for position in line + [None]:
+            letter = self.board[position[0]][position[1]] if position else '0'
+            if letter != '0':
+                letters.append(letter)
+                positions.append(position)
+                continue
                 
+            # Only consider words of 2 or more letters
+            if len(letters) > 1 and (targets is None or not targets.isdisjoint(positions)):
+                words.append(("".join(letters), positions))
+            letters = []
+            positions = []
+            
         return words
         
     def is_connected(self, row, col):
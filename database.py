@@ -2,6 +2,21 @@ import sqlite3
 import urllib.request
 import os
 
+def configure_connection(conn):
+    """
+    Apply the settings shared by every connection to the game's SQLite files.
+    
+    Args:
+        conn (sqlite3.Connection): The connection to configure
+    """
+    # page_size only takes effect before the first write to a new file; WAL mode
+    # is stored in the file, so every later connection uses it too
+    conn.execute("PRAGMA page_size=4096")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Several connections write to definitions.db, so wait for their locks instead of failing
+    conn.execute("PRAGMA busy_timeout=60000")
+
 def download_word_list(url="https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt", 
                        output_file="dictionary.txt"):
     """
@@ -105,6 +120,7 @@ def create_definitions_db(db_file="definitions.db"):
         db_file (str): Path to the SQLite database file to create.
     """
     conn = sqlite3.connect(db_file)
+    configure_connection(conn)
     cursor = conn.cursor()
 
     # Create the definitions table
@@ -8,12 +8,16 @@ import json
 from urllib.parse import quote_plus
 import sqlite3
 import os
+import threading
+from database import configure_connection
 from merriam_webster_api import merriam_webster
 
 # Dictionary of cached definitions to avoid repeated API calls
 cached_definitions = {}
-# Initialize the Merriam-Webster API client
-mw_api = MerriamWebsterAPI()
+
+# Shared connection to definitions.db, opened on first use and reused by every helper
+_conn = None
+_conn_lock = threading.RLock()
 
 def fetch_definition(word):
     """
@@ -71,24 +75,36 @@ def format_definitions(words):
     
     return formatted_text
 
+def _get_connection():
+    """
+    Get the shared definitions database connection, opening it if needed
+    
+    Returns:
+        sqlite3.Connection: The connection (autocommit mode)
+    """
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
+            _conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            configure_connection(_conn)
+        return _conn
+
 def create_definitions_database():
     """
     Create a SQLite database to store word definitions
     """
-    db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    # Create the definitions table if it doesn't exist
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS definitions (
-            word TEXT PRIMARY KEY,
-            definition TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    conn.commit()
-    conn.close()
+    with _conn_lock:
+        cursor = _get_connection().cursor()
+        
+        # Create the definitions table if it doesn't exist
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS definitions (
+                word TEXT PRIMARY KEY,
+                definition TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
 
 def get_local_definition(word):
     """
@@ -101,13 +117,10 @@ def get_local_definition(word):
         str: The definition if found, None otherwise
     """
     try:
-        db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT definition FROM definitions WHERE word = ?", (word,))
-        result = cursor.fetchone()
-        conn.close()
+        with _conn_lock:
+            result = _get_connection().execute(
+                "SELECT definition FROM definitions WHERE word = ?", (word,)
+            ).fetchone()
         
         if result:
             return result[0]
@@ -124,21 +137,12 @@ def cache_definition(word, definition):
         definition (str): The definition to cache
     """
     try:
-        db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Create the table if it doesn't exist
-        create_definitions_database()
-        
-        # Insert or replace the definition
-        cursor.execute("""
-            INSERT OR REPLACE INTO definitions (word, definition)
-            VALUES (?, ?)
-        """, (word, definition))
-        
-        conn.commit()
-        conn.close()
+        with _conn_lock:
+            # Insert or replace the definition; the table is created at import
+            _get_connection().execute("""
+                INSERT OR REPLACE INTO definitions (word, definition)
+                VALUES (?, ?)
+            """, (word, definition))
     except Exception:
         pass  # Silently fail if we can't cache the definition
 
@@ -268,20 +268,14 @@ class Game:
         if len(letters_to_exchange) > self.letter_bank.remaining_letters():
             return False
             
-        # Check if all letters are in the player's hand
-        hand = self.letter_bank.player_hand.get_letters()
-        hand_copy = hand.copy()  # Work with a copy to handle duplicate letters correctly
-        
-        for letter in letters_to_exchange:
-            if letter in hand_copy:
-                hand_copy.remove(letter)
-            else:
-                return False
+        # Check if all letters are in the player's hand (exact case, duplicates counted)
+        player_hand = self.letter_bank.player_hand
+        if not player_hand.holds_letters(letters_to_exchange):
+            return False
                 
-        # Remove letters from hand
-        for letter in letters_to_exchange:
-            self.letter_bank.player_hand.use_letter(letter)
-            self.letter_bank.return_letter(letter)
+        # Remove letters from hand and put them back in the bag
+        player_hand.remove_letters(letters_to_exchange)
+        self.letter_bank.return_letters(letters_to_exchange)
             
         # Draw new letters
         self.letter_bank.player_hand.refill()
@@ -2,27 +2,100 @@ import sys
 from PyQt5.QtWidgets import (
     QMainWindow, QApplication, QWidget, QLabel, QPushButton, QVBoxLayout, 
     QHBoxLayout, QGridLayout, QFrame, QLineEdit, QMessageBox, QAction, 
-    QMenu, QMenuBar, QStatusBar, QRadioButton, QSizePolicy
+    QMenu, QMenuBar, QStatusBar, QRadioButton, QSizePolicy, QActionGroup
 )
-from PyQt5.QtGui import QFont, QIcon, QKeySequence, QDrag
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QMimeData, QPoint
+from PyQt5.QtGui import QFont, QIcon, QKeySequence, QDrag, QPainter, QPixmap, QPixmapCache, QColor
+from PyQt5.QtCore import Qt, QSize, QRect, pyqtSignal, pyqtSlot, QMimeData, QPoint, QTimer, QObject, QThread
 from board import Board
 from letter_bank import LetterBank
 from scoring import Scoring
 from merriam_webster_api import COLLEGIATE, LEARNERS
 
+RULES_TEXT = """
+<h2>Word Mosaic Rules</h2>
+<ol>
+    <li><b>Setup:</b> Start with 20 letters and an empty 15x15 grid</li>
+    <li><b>First Word:</b> Your first word must cross the center tile</li>
+    <li><b>Word Placement:</b> All words must read left-to-right or top-to-bottom</li>
+    <li><b>Connections:</b> Every new word must connect to at least one existing word</li>
+    <li><b>Valid Words:</b> All created words must be valid English words</li>
+    <li><b>Letter Replenishment:</b> Gain new letters after successful placement</li>
+    <li><b>Game End:</b> The game ends when no more valid placements are possible</li>
+</ol>
+<p>Special tiles can multiply letter or word scores!</p>
+"""
+
+ABOUT_TEXT = """
+<h2>Word Mosaic</h2>
+<p>Version 1.0</p>
+<p>A single-player word strategy game built with Python and PyQt5.</p>
+<p>© 2025 Samuel Rumbley</p>
+"""
+
+# Background colors for special board tiles
+SPECIAL_TILE_COLORS = {
+    "TW": "#ff6666",
+    "DW": "#ff9999",
+    "TL": "#66b3ff",
+    "DL": "#99ccff",
+}
+
 class ClickableLabel(QLabel):
     """
     A QLabel that emits a signal when clicked.
+
+    Board cells paint their own letter and score instead of hosting child
+    widgets, so each cell is a single widget.
     """
     clicked = pyqtSignal(int, int)
+    dropped = pyqtSignal(int, int, str)
+
+    # Fonts are shared by every cell; created on first use because QFont
+    # needs a running QApplication
+    letter_font = None
+    score_font = None
 
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
         self.row = None
         self.col = None
+        self.letter = ""
+        self.score = ""
         self.setAcceptDrops(True)  # Enable drop events
 
+        if ClickableLabel.letter_font is None:
+            ClickableLabel.letter_font = QFont("Arial", 16, QFont.Bold)
+            ClickableLabel.score_font = QFont("Arial", 7)
+
+    def set_tile(self, letter, score):
+        """
+        Set the letter and score shown on this cell.
+
+        Args:
+            letter (str): Letter to display, or "" for an empty cell
+            score (str): Score to display in the bottom-right corner
+        """
+        # Skip the repaint when nothing changed
+        if letter == self.letter and score == self.score:
+            return
+        self.letter = letter
+        self.score = score
+        self.update()
+
+    def paintEvent(self, event):
+        # Let the style sheet draw the background and border first
+        super().paintEvent(event)
+        if not self.letter:
+            return
+
+        painter = QPainter(self)
+        rect = self.contentsRect()
+        painter.setFont(self.letter_font)
+        painter.drawText(rect, Qt.AlignCenter, self.letter)
+        painter.setFont(self.score_font)
+        painter.drawText(rect.adjusted(0, 0, -3, -2), Qt.AlignRight | Qt.AlignBottom, self.score)
+        painter.end()
+
     def mousePressEvent(self, event):
         if self.row is not None and self.col is not None:
             self.clicked.emit(self.row, self.col)
@@ -38,8 +111,7 @@ class ClickableLabel(QLabel):
             letter = event.mimeData().text()
             event.accept()
             if self.row is not None and self.col is not None:
-                self.clicked.emit(self.row, self.col)
-                # The letter will be handled by the parent widget's handle_cell_click
+                self.dropped.emit(self.row, self.col, letter)
 
 class DraggableLetterLabel(QLabel):
     """
@@ -47,53 +119,138 @@ class DraggableLetterLabel(QLabel):
     """
     clicked = pyqtSignal(str)
 
+    # Shared font for the value in the corner, created on first use
+    value_font = None
+
     def __init__(self, letter, value, parent=None):
-        super().__init__(letter, parent)
-        self.letter = letter
-        self.value = value
+        super().__init__("", parent)
         self.selected = False
+        self._press_pos = None
         self.setStyleSheet("background-color: #ffd700; border: 1px solid #c0c0c0; border-radius: 4px;")
         self.setAlignment(Qt.AlignCenter)
         self.setFont(QFont("Arial", 14, QFont.Bold))
         self.setFixedSize(40, 40)
         
-        # Add a small value indicator in the corner
-        if letter != '0':  # Don't show value for blank tiles
-            value_label = QLabel(str(value), self)
-            value_label.setAlignment(Qt.AlignRight | Qt.AlignBottom)
-            value_label.setFont(QFont("Arial", 7))
-            value_label.setGeometry(25, 25, 15, 15)
-            value_label.setStyleSheet("background-color: transparent; border: none;")
+        if DraggableLetterLabel.value_font is None:
+            DraggableLetterLabel.value_font = QFont("Arial", 7)
+        
+        self.set_letter(letter, value)
+
+    def set_letter(self, letter, value):
+        """
+        Show a letter on this tile, so tiles can be reused as the hand changes.
+        
+        Args:
+            letter (str): The letter, or '0' for a blank tile
+            value (int): The letter's point value
+        """
+        self.letter = letter
+        self.value = value
+        # Blank tiles show neither a letter nor a value
+        self.setText(letter if letter != '0' else " ")
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.letter == '0':
+            return
+            
+        # Paint the value in the corner instead of using a child label
+        painter = QPainter(self)
+        painter.setFont(self.value_font)
+        painter.drawText(QRect(25, 25, 13, 13), Qt.AlignRight | Qt.AlignBottom, str(self.value))
+        painter.end()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            # Only remember where the press happened; a drag starts once the
+            # mouse has moved far enough, so plain clicks never block in exec_()
+            self._press_pos = event.pos()
             self.clicked.emit(self.letter)  # Emit clicked signal
-            
-            # Start drag operation
-            drag = QDrag(self)
-            mime_data = QMimeData()
-            mime_data.setText(self.letter)
-            drag.setMimeData(mime_data)
-            
-            # Optionally, set a pixmap for the drag operation
-            # pixmap = self.grab()
-            # drag.setPixmap(pixmap)
-            
-            # Execute the drag
-            drag.exec_(Qt.CopyAction)
+
+    def mouseMoveEvent(self, event):
+        if not (event.buttons() & Qt.LeftButton) or self._press_pos is None:
+            return
+        if (event.pos() - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        self._press_pos = None
+
+        # QDrag takes ownership of its mime data, so it can't be shared between drags
+        drag = QDrag(self)
+        mime_data = QMimeData()
+        mime_data.setText(self.letter)
+        drag.setMimeData(mime_data)
+        
+        # Use the prerendered tile image rather than grabbing the widget
+        pixmap = QPixmapCache.find(f"tile:{self.letter}")
+        if pixmap is not None and not pixmap.isNull():
+            drag.setPixmap(pixmap)
+        
+        # Execute the drag
+        drag.exec_(Qt.CopyAction)
         
     def set_selected(self, selected):
         """Mark this letter as selected or not."""
+        if selected == self.selected:
+            return
         self.selected = selected
         if selected:
             self.setStyleSheet("background-color: #ff9966; border: 2px solid #c0c0c0; border-radius: 4px;")
         else:
             self.setStyleSheet("background-color: #ffd700; border: 1px solid #c0c0c0; border-radius: 4px;")
 
+class ValidationWorker(QObject):
+    """
+    Validates words and looks up their definitions on a background thread so
+    dictionary lookups don't freeze the GUI.
+    """
+    finished = pyqtSignal(list, list, dict, str)  # (valid_words, invalid_words, definitions, error)
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    @pyqtSlot(list)
+    def run(self, words):
+        """
+        Validate a list of (word, positions) tuples and emit the results.
+        
+        Definitions are only looked up when every word is valid.
+        
+        Args:
+            words (list): Words formed on the board with their positions
+        """
+        # finished is always emitted, even on failure, so the window never stays stuck validating
+        try:
+            # Validate every word in one batch so the dictionary lookups overlap
+            accepted = set(self.game.word_validator.validate_words([word for word, _ in words]))
+        
+            valid_words = []
+            invalid_words = []
+            for word, positions in words:
+                if word in accepted:
+                    valid_words.append((word, positions))
+                else:
+                    invalid_words.append(word)
+                
+            definitions = {}
+            if not invalid_words:
+                for word, _ in valid_words:
+                    if word not in definitions:
+                        definitions[word] = self.game.get_word_definition(word)
+                    
+        except Exception as e:
+            self.finished.emit([], [], {}, str(e))
+            return
+            
+        self.finished.emit(valid_words, invalid_words, definitions, "")
+
 class WordMosaicApp(QMainWindow):
     """
     Graphical User Interface for Word Mosaic game using PyQt5
     """
+    validation_requested = pyqtSignal(list)
+
     def __init__(self, game):
         """
         Initialize the GUI with the game logic.
@@ -106,9 +263,39 @@ class WordMosaicApp(QMainWindow):
         
         # Initialize game state
         self.selected_letter = None  # Currently selected letter from the letter bank
-        self.current_turn_tiles = []  # Track tiles placed in the current turn
+        self.current_turn_tiles = {}  # Track tiles placed in the current turn {(row, col): letter}
         self.is_game_over = False
         
+        # Message box reused by the rules, about and status dialogs
+        self._info_box = None
+        
+        # Display refreshes waiting for the next event loop pass
+        self._pending_updates = set()
+        
+        # Letter bank labels and the hand they were last built from
+        self.letter_labels = []
+        self._labels_by_letter = {}  # First label showing each letter
+        self._last_bank_sig = ()
+        
+        # Word checks after a placement are debounced so bursts of clicks
+        # trigger a single (possibly network-bound) validation pass
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(150)
+        self._check_timer.timeout.connect(self._check_for_words)
+        
+        # Definitions already looked up this session {word: definition}
+        self._def_cache = {}
+        
+        # End-of-turn validation runs on a worker thread
+        self._validating = False
+        self._validation_thread = QThread(self)
+        self._validation_worker = ValidationWorker(self.game)
+        self._validation_worker.moveToThread(self._validation_thread)
+        self.validation_requested.connect(self._validation_worker.run)
+        self._validation_worker.finished.connect(self._on_validation_done)
+        self._validation_thread.start()
+        
         # Set window properties
         self.setWindowTitle("Word Mosaic")
         self.setGeometry(100, 100, 800, 600)
@@ -117,6 +304,9 @@ class WordMosaicApp(QMainWindow):
         # Dictionary setting
         self.selected_dictionary = self.game.word_validator.dictionary_type
         
+        # Prerender drag images for every tile
+        self._cache_tile_pixmaps()
+        
         # Create main widget and layout
         self.main_widget = QWidget()
         self.setCentralWidget(self.main_widget)
@@ -130,10 +320,57 @@ class WordMosaicApp(QMainWindow):
         self._create_action_frame()  # Renamed from word_entry_frame
         self._create_status_bar()  # Added status bar
         
-        # Initialize letters for a new game
-        self.update_board_display()
-        self.update_letter_bank_display()
-        self.update_score_display()
+        # Populate the board and letters once the window has been shown
+        self._schedule_update("board", "bank", "score")
+    
+    def _schedule_update(self, *kinds):
+        """
+        Queue display refreshes to run together on the next event loop pass.
+        
+        Args:
+            kinds (str): Any of "board", "bank" and "score"
+        """
+        if not self._pending_updates:
+            QTimer.singleShot(0, self._flush_updates)
+        self._pending_updates.update(kinds)
+    
+    def _flush_updates(self):
+        """Run the queued display refreshes in one batch."""
+        pending = self._pending_updates
+        self._pending_updates = set()
+        if "board" in pending:
+            self.update_board_display()
+        if "bank" in pending:
+            self.update_letter_bank_display()
+        if "score" in pending:
+            self.update_score_display()
+    
+    def _cache_tile_pixmaps(self):
+        """Render one 40x40 tile image per letter into QPixmapCache for drag previews."""
+        letter_font = QFont("Arial", 14, QFont.Bold)
+        value_font = QFont("Arial", 7)
+        
+        for letter in "abcdefghijklmnopqrstuvwxyz0":
+            pixmap = QPixmap(40, 40)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QColor("#c0c0c0"))
+            painter.setBrush(QColor("#ffd700"))
+            painter.drawRoundedRect(0, 0, 39, 39, 4, 4)
+            
+            # Blank tiles show no letter or value
+            if letter != '0':
+                painter.setPen(Qt.black)
+                painter.setFont(letter_font)
+                painter.drawText(pixmap.rect(), Qt.AlignCenter, letter)
+                painter.setFont(value_font)
+                value = self.game.letter_bank.get_letter_value(letter)
+                painter.drawText(QRect(25, 25, 13, 13), Qt.AlignRight | Qt.AlignBottom, str(value))
+            painter.end()
+            
+            QPixmapCache.insert(f"tile:{letter}", pixmap)
     
     def _create_menu(self):
         """Create the menu bar with game options."""
@@ -165,16 +402,24 @@ class WordMosaicApp(QMainWindow):
         dictionary_menu = QMenu('&Dictionary', self)
         options_menu.addMenu(dictionary_menu)
         
+        # The action group keeps exactly one dictionary checked
+        dictionary_group = QActionGroup(self)
+        dictionary_group.setExclusive(True)
+        
         collegiate_action = QAction('&Collegiate Dictionary', self)
         collegiate_action.setCheckable(True)
         collegiate_action.setChecked(self.selected_dictionary == COLLEGIATE)
-        collegiate_action.triggered.connect(lambda: self.change_dictionary(COLLEGIATE))
+        collegiate_action.setData(COLLEGIATE)
+        collegiate_action.setActionGroup(dictionary_group)
+        collegiate_action.triggered.connect(self._on_dict_action)
         dictionary_menu.addAction(collegiate_action)
         
         learners_action = QAction("&Learner's Dictionary", self)
         learners_action.setCheckable(True)
         learners_action.setChecked(self.selected_dictionary == LEARNERS)
-        learners_action.triggered.connect(lambda: self.change_dictionary(LEARNERS))
+        learners_action.setData(LEARNERS)
+        learners_action.setActionGroup(dictionary_group)
+        learners_action.triggered.connect(self._on_dict_action)
         dictionary_menu.addAction(learners_action)
         
         self.dictionary_actions = [collegiate_action, learners_action]
@@ -202,12 +447,14 @@ class WordMosaicApp(QMainWindow):
         top_layout.setContentsMargins(0, 0, 0, 10)
         
         # Score display
+        self._shown_score = 0
         self.score_label = QLabel("Score: 0")
         self.score_label.setFont(QFont("Arial", 16))
         top_layout.addWidget(self.score_label, 1, Qt.AlignLeft)
         
         # Dictionary indicator
-        self.dictionary_label = QLabel(f"Dictionary: {self.game.word_validator.dictionary_name}")
+        self._current_dict_name = self.game.word_validator.dictionary_name
+        self.dictionary_label = QLabel(f"Dictionary: {self._current_dict_name}")
         self.dictionary_label.setFont(QFont("Arial", 12))
         top_layout.addWidget(self.dictionary_label, 0, Qt.AlignRight)
         
@@ -234,53 +481,23 @@ class WordMosaicApp(QMainWindow):
         for row in range(self.game.board.rows):
             cell_row = []
             for col in range(self.game.board.cols):
-                # Create a frame for each cell to contain letter and score
-                cell_frame = QFrame()
-                cell_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-                cell_frame.setMinimumSize(40, 40)  # Minimum size for the cell
+                # Each cell is a single label that paints its letter and score
+                cell = ClickableLabel("")
+                cell.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+                cell.setMinimumSize(40, 40)  # Minimum size for the cell
                 
                 # Get special tile info to set background color
                 special_tile = self.game.board.get_special_tile_multiplier(row, col)
-                if special_tile:
-                    if special_tile == "TW":
-                        cell_frame.setStyleSheet("background-color: #ff6666; border: 2px solid #c0c0c0; border-radius: 4px;")
-                    elif special_tile == "DW":
-                        cell_frame.setStyleSheet("background-color: #ff9999; border: 2px solid #c0c0c0; border-radius: 4px;")
-                    elif special_tile == "TL":
-                        cell_frame.setStyleSheet("background-color: #66b3ff; border: 2px solid #c0c0c0; border-radius: 4px;")
-                    elif special_tile == "DL":
-                        cell_frame.setStyleSheet("background-color: #99ccff; border: 2px solid #c0c0c0; border-radius: 4px;")
-                else:
-                    cell_frame.setStyleSheet("background-color: #ffffff; border: 2px solid #c0c0c0; border-radius: 4px;")
-                
-                # Use layout for each cell to position letter and score
-                cell_layout = QGridLayout(cell_frame)
-                cell_layout.setContentsMargins(2, 2, 2, 2)
-                cell_layout.setSpacing(0)
-                
-                # Create cell label for the letter
-                cell = ClickableLabel("")
-                cell.setAlignment(Qt.AlignCenter)
-                cell.setFont(QFont("Arial", 16, QFont.Bold))
-                cell.setStyleSheet("background-color: transparent; border: none;")
-                cell_layout.addWidget(cell, 0, 0, 1, 1, Qt.AlignCenter)
-                
-                # Add score label to the bottom right
-                score_label = QLabel("")
-                score_label.setAlignment(Qt.AlignRight | Qt.AlignBottom)
-                score_label.setFont(QFont("Arial", 7))
-                score_label.setStyleSheet("background-color: transparent; border: none;")
-                cell_layout.addWidget(score_label, 0, 0, 1, 1, Qt.AlignRight | Qt.AlignBottom)
+                background = SPECIAL_TILE_COLORS.get(special_tile, "#ffffff")
+                cell.setStyleSheet(f"background-color: {background}; border: 2px solid #c0c0c0; border-radius: 4px;")
                 
                 # Connect click event to handler
                 cell.clicked.connect(self.handle_cell_click)
+                cell.dropped.connect(self.handle_cell_drop)
                 cell.row = row
                 cell.col = col
                 
-                # Store both labels for later access
-                cell.score_label = score_label
-                
-                board_layout.addWidget(cell_frame, row, col)
+                board_layout.addWidget(cell, row, col)
                 cell_row.append(cell)
             self.board_cells.append(cell_row)
         
@@ -291,6 +508,11 @@ class WordMosaicApp(QMainWindow):
         
     def handle_cell_click(self, row, col):
         """Handle click on a board cell."""
+        # The board must not change while the turn is being validated
+        if self._validating:
+            self.status_bar.showMessage("Validating…")
+            return
+            
         # If a letter is selected from the letter bank
         if self.selected_letter:
             # Try to place the letter on the board
@@ -301,46 +523,45 @@ class WordMosaicApp(QMainWindow):
                 self.game.letter_bank.use_letters(self.selected_letter)
                 
                 # Add to the current turn's tiles
-                self.current_turn_tiles.append((row, col, self.selected_letter))
+                self.current_turn_tiles[(row, col)] = self.selected_letter
                 
                 # Update displays
-                self.update_board_display()
-                self.update_letter_bank_display()
+                self._schedule_update("board", "bank")
                 
                 # Reset selected letter
                 self.selected_letter = None
                 
-                # After placing, check for valid words
-                self._check_for_words()
+                # After placing, check for valid words once clicks settle
+                self._check_timer.start()
                 
                 self.status_bar.showMessage(f"Letter placed at position ({row}, {col})")
             except ValueError as e:
                 self.status_bar.showMessage(f"Cannot place letter: {str(e)}")
         else:
             # If no letter is selected, check if there's a letter on the cell that can be removed
-            letter_removed = False
-            for i, (r, c, letter) in enumerate(self.current_turn_tiles):
-                if r == row and c == col:
-                    # Remove the letter from the board
-                    self.game.board.clear_position(row, col)
-                    
-                    # Return the letter to the player's hand
-                    self.game.letter_bank.add_letter(letter)
-                    
-                    # Remove from current turn tiles
-                    self.current_turn_tiles.pop(i)
-                    
-                    # Update displays
-                    self.update_board_display()
-                    self.update_letter_bank_display()
-                    
-                    self.status_bar.showMessage(f"Letter removed from position ({row}, {col})")
-                    letter_removed = True
-                    break
-                    
-            if not letter_removed:
+            letter = self.current_turn_tiles.pop((row, col), None)
+            if letter is not None:
+                # Remove the letter from the board
+                self.game.board.clear_position(row, col)
+                
+                # Return the letter to the player's hand
+                self.game.letter_bank.add_letter(letter)
+                
+                # Update displays
+                self._schedule_update("board", "bank")
+                
+                self.status_bar.showMessage(f"Letter removed from position ({row}, {col})")
+            else:
                 self.status_bar.showMessage("Select a letter first, then click on the board to place it")
     
+    def handle_cell_drop(self, row, col, letter):
+        """Handle a letter from the letter bank being dropped on a board cell."""
+        # Refuse the drop before it changes the selection, as board clicks are refused
+        if self._validating:
+            return
+        self.selected_letter = letter
+        self.handle_cell_click(row, col)
+    
     def _create_letter_bank_frame(self):
         """Create the frame that displays available letters."""
         letter_bank_widget = QWidget()
@@ -358,6 +579,9 @@ class WordMosaicApp(QMainWindow):
         self.letter_bank_layout.setSpacing(5)
         self.letter_bank_layout.setAlignment(Qt.AlignCenter)
         
+        # Letter tiles are kept and reused rather than recreated each update
+        self._tile_pool = []
+        
         letter_bank_layout.addWidget(self.letter_bank_frame)
         self.main_layout.addWidget(letter_bank_widget)
     
@@ -391,11 +615,9 @@ class WordMosaicApp(QMainWindow):
     def select_letter(self, letter):
         """Handle selection of a letter from the letter bank."""
         # If another letter was already selected, deselect it first
-        if self.selected_letter:
-            for letter_label in self.letter_labels:
-                if letter_label.letter == self.selected_letter:
-                    letter_label.set_selected(False)
-                    break
+        previous_label = self._labels_by_letter.get(self.selected_letter)
+        if previous_label:
+            previous_label.set_selected(False)
         
         # Update the selected letter
         if self.selected_letter == letter:  # If clicking the same letter, deselect it
@@ -404,65 +626,74 @@ class WordMosaicApp(QMainWindow):
         else:
             self.selected_letter = letter
             # Update the visual selection state
-            for letter_label in self.letter_labels:
-                if letter_label.letter == letter:
-                    letter_label.set_selected(True)
-                    self.status_bar.showMessage(f"Selected letter: {letter}")
-                    break
+            letter_label = self._labels_by_letter.get(letter)
+            if letter_label:
+                letter_label.set_selected(True)
+                self.status_bar.showMessage(f"Selected letter: {letter}")
     
     def update_board_display(self):
         """Update the board display based on the current game state."""
-        for row in range(self.game.board.rows):
-            for col in range(self.game.board.cols):
-                cell = self.board_cells[row][col]
-                letter = self.game.board.board[row][col]
-                
+        for cell_row, letter_row in zip(self.board_cells, self.game.board.board):
+            for cell, letter in zip(cell_row, letter_row):
                 # For blank tiles, display nothing (not '0')
                 if letter == '0':
-                    cell.setText("")
-                    cell.score_label.setText("")
-                else:
-                    cell.setText(letter)
+                    letter = ""
+                    
+                # Cells whose letter hasn't changed are left alone
+                if letter == cell.letter:
+                    continue
+                    
+                if letter:
                     # If the cell has a letter, show its score value in the corner
-                    if letter:
-                        score = self.game.letter_bank.get_letter_value(letter.lower()) if letter else ""
-                        cell.score_label.setText(str(score))
-                    else:
-                        cell.score_label.setText("")
+                    score = self.game.letter_bank.get_letter_value(letter.lower())
+                    cell.set_tile(letter, str(score))
+                else:
+                    cell.set_tile("", "")
     
     def update_letter_bank_display(self):
         """Update the letter bank display with current available letters."""
-        # Clear current letters
-        while self.letter_bank_layout.count():
-            item = self.letter_bank_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-        
         # Get available letters from the game
         available_letters = self.game.letter_bank.get_available_letters()
         
-        # Create new letter labels
+        # Nothing to do if the hand (including its order) hasn't changed
+        bank_sig = tuple(available_letters)
+        if bank_sig == self._last_bank_sig:
+            return
+        self._last_bank_sig = bank_sig
+        
+        # Reuse pooled tiles, creating new ones only when the hand grows
         self.letter_labels = []
-        for letter in available_letters:
-            # Show blank tiles as empty but still selectable
-            display_letter = letter if letter != '0' else " "
+        self._labels_by_letter = {}
+        for i, letter in enumerate(available_letters):
             letter_value = self.game.letter_bank.get_letter_value(letter)
             
-            letter_label = DraggableLetterLabel(letter, letter_value)
-            letter_label.setText(display_letter)
-            letter_label.clicked.connect(self.select_letter)
+            if i < len(self._tile_pool):
+                letter_label = self._tile_pool[i]
+                letter_label.set_letter(letter, letter_value)
+                letter_label.show()
+            else:
+                letter_label = DraggableLetterLabel(letter, letter_value)
+                letter_label.clicked.connect(self.select_letter)
+                self.letter_bank_layout.addWidget(letter_label)
+                self._tile_pool.append(letter_label)
             
             # If this letter is currently selected, mark it
-            if self.selected_letter == letter:
-                letter_label.set_selected(True)
+            letter_label.set_selected(self.selected_letter == letter)
             
-            self.letter_bank_layout.addWidget(letter_label)
             self.letter_labels.append(letter_label)
+            self._labels_by_letter.setdefault(letter, letter_label)
+        
+        # Hide tiles left over from a larger hand
+        for letter_label in self._tile_pool[len(available_letters):]:
+            letter_label.hide()
     
     def update_score_display(self):
         """Update the score display."""
-        self.score_label.setText(f"Score: {self.game.score}")
+        # Only touch the label when the score actually changed
+        if self.game.score == self._shown_score:
+            return
+        self._shown_score = self.game.score
+        self.score_label.setText(f"Score: {self._shown_score}")
     
     def end_turn(self):
         """End the current turn and process the words formed."""
@@ -470,68 +701,101 @@ class WordMosaicApp(QMainWindow):
             self.status_bar.showMessage("No letters placed this turn")
             return
 
-        # Get all words formed
-        words = self.game.board.get_all_words()
-        valid_words = []
-        invalid_words = []
+        if self._validating:
+            return
 
-        for word, positions in words:
-            if len(word) > 1:  # Only consider words with at least 2 letters
-                if self.game.word_validator.validate_word(word):
-                    valid_words.append((word, positions))
-                else:
-                    invalid_words.append(word)
+        # The turn is validated below, so a pending placement check is redundant
+        self._check_timer.stop()
+
+        # Get all words formed (only words with at least 2 letters count)
+        words = [(word, positions) for word, positions in self.game.board.get_all_words() if len(word) > 1]
+
+        self._validating = True
+        self.status_bar.showMessage("Validating…")
+        self.validation_requested.emit(words)
+
+    @pyqtSlot(list, list, dict, str)
+    def _on_validation_done(self, valid_words, invalid_words, definitions, error):
+        """Finish the turn once the validation worker has checked and defined the words."""
+        self._validating = False
+        if error:
+            self.status_bar.showMessage(f"Could not validate words: {error}")
+            return
+        self._def_cache.update(definitions)
 
         if invalid_words:
-            QMessageBox.warning(self, "Invalid Words", 
-                f"The following words are not valid: {', '.join(invalid_words)}\n\nPlease try again.")
+            self.update_words_display([], invalid=invalid_words)
+            self.status_bar.showMessage("Invalid words formed. Please try again.")
             return
 
         # Display words formed, their scores, and definitions
         turn_score = 0
-        words_summary = "Words formed this turn:\n"
+        summary_parts = ["Words formed this turn:\n"]
         for word, positions in valid_words:
             word_score = self.game.scoring.calculate_word_score(word, positions)
             turn_score += word_score
-            definition = self.game.get_word_definition(word)
-            words_summary += f"- {word}: {word_score} points\n  Definition: {definition}\n"
+            definition = self._definition(word)
+            summary_parts.append(f"- {word}: {word_score} points\n  Definition: {definition}\n")
 
-        words_summary += f"\nTotal score this turn: {turn_score}"
-        self.status_bar.showMessage(words_summary)
+        summary_parts.append(f"\nTotal score this turn: {turn_score}")
+        self.status_bar.showMessage("".join(summary_parts))
 
         # Update game state
         self.game.score += turn_score
-        self.update_score_display()
+        self._schedule_update("score")
 
         # Add words to played words list
         for word, _ in valid_words:
-            if word not in self.game.played_words:
-                self.game.played_words.append(word)
+            self.game.add_played_word(word)
 
         # Clear the current turn's tiles
-        self.current_turn_tiles = []
+        self.current_turn_tiles.clear()
 
         # Refill the player's hand
         self.game.letter_bank.refill_hand()
-        self.update_letter_bank_display()
+        self._schedule_update("bank")
 
         # Update the GUI to show words and definitions
         self.update_words_display(valid_words)
 
-    def update_words_display(self, valid_words):
-        """Update the GUI to show words formed and their definitions."""
+    def update_words_display(self, valid_words, invalid=None):
+        """
+        Update the GUI to show words formed and their definitions.
+        
+        Args:
+            valid_words (list): List of (word, positions) tuples for valid words
+            invalid (list, optional): Invalid words to report instead of definitions
+        """
         if not hasattr(self, 'words_display_label'):
             self.words_display_label = QLabel()
             self.words_display_label.setFont(QFont("Arial", 12))
             self.words_display_label.setStyleSheet("background-color: #ffffff; padding: 10px; border: 1px solid #c0c0c0;")
             self.main_layout.addWidget(self.words_display_label)
 
-        words_text = "<b>Words Formed:</b><br>"
-        for word, _ in valid_words:
-            definition = self.game.get_word_definition(word)
-            words_text += f"<b>{word}</b>: {definition}<br>"
+        if invalid:
+            self.words_display_label.setText(
+                f"<span style='color:red'>Invalid: {', '.join(invalid)}</span><br>")
+            return
 
-        self.words_display_label.setText(words_text)
+        # Build the whole rich-text document before a single setText
+        parts = ["<b>Words Formed:</b><br>"]
+        parts.extend(f"<b>{word}</b>: {self._definition(word)}<br>" for word, _ in valid_words)
+        self.words_display_label.setText("".join(parts))
+    
+    def _definition(self, word):
+        """
+        Get a word's definition, reusing earlier lookups from this session.
+        
+        Args:
+            word (str): The word to define
+            
+        Returns:
+            str: The definition of the word
+        """
+        definition = self._def_cache.get(word)
+        if definition is None:
+            definition = self._def_cache.setdefault(word, self.game.get_word_definition(word))
+        return definition
     
     def shuffle_letters(self):
         """Shuffle the letters in the player's hand."""
@@ -543,7 +807,11 @@ class WordMosaicApp(QMainWindow):
     
     def _check_for_words(self):
         """Check if any words have been formed with the placed letters."""
-        words = self.game.board.get_all_words()
+        # Skip while the worker thread is using the validator
+        if self._validating:
+            return
+        # Only the rows and columns touched this turn can hold new words
+        words = self.game.board.get_words_through(self.current_turn_tiles)
         for word, positions in words:
             if len(word) > 1:  # Only consider words with at least 2 letters
                 # Validate the word
@@ -553,71 +821,76 @@ class WordMosaicApp(QMainWindow):
                 else:
                     self.status_bar.showMessage(f"Warning: '{word}' is not a valid word")
     
+    def closeEvent(self, event):
+        """Stop the validation thread before the window closes."""
+        self._validation_thread.quit()
+        self._validation_thread.wait()
+        super().closeEvent(event)
+        
     def new_game(self):
         """Start a new game."""
+        # A pending validation result would otherwise land in the fresh game
+        if self._validating:
+            self.status_bar.showMessage("Validating…")
+            return
+            
         self.game.new_game()
-        self.update_board_display()
-        self.update_letter_bank_display()
-        self.update_score_display()
+        self._schedule_update("board", "bank", "score")
         self.status_bar.showMessage("New game started!")
         
     def show_high_scores(self):
         """Show high scores dialog."""
         QMessageBox.information(self, "High Scores", "High scores feature coming soon!")
         
+    def _on_dict_action(self):
+        """Switch to the dictionary stored on the triggering menu action."""
+        self.change_dictionary(self.sender().data())
+        
     def change_dictionary(self, dictionary_type):
         """Change the dictionary type."""
+        # Re-selecting the active dictionary keeps its client and cached definitions
+        if dictionary_type.lower() == self.selected_dictionary.lower():
+            return
+            
+        # The worker thread is using the validator; keep the current dictionary checked
+        if self._validating:
+            for action in self.dictionary_actions:
+                action.setChecked(action.data().lower() == self.selected_dictionary.lower())
+            self.status_bar.showMessage("Validating…")
+            return
+            
         info = self.game.word_validator.switch_dictionary(dictionary_type)
+        self._def_cache.clear()
         self.selected_dictionary = dictionary_type
         
-        # Update the dictionary actions
-        for action in self.dictionary_actions:
-            action.setChecked(False)
-            
-        if dictionary_type == COLLEGIATE:
-            self.dictionary_actions[0].setChecked(True)
-        else:
-            self.dictionary_actions[1].setChecked(True)
-            
-        self.dictionary_label.setText(f"Dictionary: {self.game.word_validator.dictionary_name}")
+        dictionary_name = self.game.word_validator.dictionary_name
+        if dictionary_name != self._current_dict_name:
+            self._current_dict_name = dictionary_name
+            self.dictionary_label.setText(f"Dictionary: {dictionary_name}")
         self.status_bar.showMessage(f"Switched to {info.get('name', dictionary_type)} dictionary.")
         
-    def show_rules(self):
-        """Show game rules."""
-        rules_text = """
-        <h2>Word Mosaic Rules</h2>
-        <ol>
-            <li><b>Setup:</b> Start with 20 letters and an empty 15x15 grid</li>
-            <li><b>First Word:</b> Your first word must cross the center tile</li>
-            <li><b>Word Placement:</b> All words must read left-to-right or top-to-bottom</li>
-            <li><b>Connections:</b> Every new word must connect to at least one existing word</li>
-            <li><b>Valid Words:</b> All created words must be valid English words</li>
-            <li><b>Letter Replenishment:</b> Gain new letters after successful placement</li>
-            <li><b>Game End:</b> The game ends when no more valid placements are possible</li>
-        </ol>
-        <p>Special tiles can multiply letter or word scores!</p>
+    def _show_info(self, title, text):
         """
+        Show rich-text information in a message box that is reused between calls.
         
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Game Rules")
-        msg_box.setTextFormat(Qt.RichText)
-        msg_box.setText(rules_text)
-        msg_box.exec_()
+        Args:
+            title (str): Window title
+            text (str): Rich-text body
+        """
+        if self._info_box is None:
+            self._info_box = QMessageBox(self)
+            self._info_box.setTextFormat(Qt.RichText)
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(text)
+        self._info_box.exec_()
+        
+    def show_rules(self):
+        """Show game rules."""
+        self._show_info("Game Rules", RULES_TEXT)
         
     def show_about(self):
         """Show about dialog."""
-        about_text = """
-        <h2>Word Mosaic</h2>
-        <p>Version 1.0</p>
-        <p>A single-player word strategy game built with Python and PyQt5.</p>
-        <p>© 2025 Samuel Rumbley</p>
-        """
-        
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("About")
-        msg_box.setTextFormat(Qt.RichText)
-        msg_box.setText(about_text)
-        msg_box.exec_()
+        self._show_info("About", ABOUT_TEXT)
         
     def show_dictionary_status(self):
         """Show dictionary status."""
@@ -630,11 +903,7 @@ class WordMosaicApp(QMainWindow):
         <p><b>Local Dictionary:</b> {info.get('db_word_count', 0)} words available offline</p>
         """
         
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("Dictionary Status")
-        msg_box.setTextFormat(Qt.RichText)
-        msg_box.setText(status_text)
-        msg_box.exec_()
+        self._show_info("Dictionary Status", status_text)
 
 # Main application entry point
 if __name__ == "__main__":
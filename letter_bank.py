@@ -1,10 +1,12 @@
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 class PlayerHand:
     """
     Represents a player's current hand of letters
     """
+    __slots__ = ('letter_bank', 'hand_size', 'letters')
+    
     def __init__(self, letter_bank, hand_size=7):
         """
         Initialize a player's hand
@@ -28,14 +30,11 @@ class PlayerHand:
         if len(self.letters) >= self.hand_size:
             return False
             
-        letters_added = 0
-        while len(self.letters) < self.hand_size and self.letter_bank.letters_available():
-            letter = self.letter_bank.draw_letter()
-            if letter:
-                self.letters.append(letter)
-                letters_added += 1
+        # Draw everything needed in one call
+        drawn = self.letter_bank.draw_letters(self.hand_size - len(self.letters))
+        self.letters.extend(drawn)
         
-        return letters_added > 0
+        return len(drawn) > 0
         
     def use_letter(self, letter):
         """
@@ -52,6 +51,22 @@ class PlayerHand:
             return True
         return False
         
+    def remove_letters(self, letters):
+        """
+        Remove several letters from the player's hand in one pass
+        
+        Args:
+            letters (iterable): The letters to remove
+        """
+        pending = Counter(letters)
+        kept = []
+        for letter in self.letters:
+            if pending[letter]:
+                pending[letter] -= 1
+            else:
+                kept.append(letter)
+        self.letters = kept
+        
     def add_letter(self, letter):
         """
         Add a letter back to the player's hand (e.g., when removing from board)
@@ -71,6 +86,30 @@ class PlayerHand:
         """
         return self.letters
         
+    def holds_letters(self, letters):
+        """
+        Check if the hand holds every given letter, counting duplicates and matching case exactly
+        
+        Args:
+            letters (iterable): The letters to look for
+            
+        Returns:
+            bool: True if the hand holds all of the letters, False otherwise
+        """
+        return Counter(letters) <= Counter(self.letters)
+        
+    def can_form_word(self, word):
+        """
+        Check if the hand holds enough of each letter to spell a word
+        
+        Args:
+            word (str): The word to check
+            
+        Returns:
+            bool: True if the word can be formed from the hand, False otherwise
+        """
+        return self.holds_letters(word.lower())
+        
     def shuffle_letters(self):
         """
         Shuffle the letters in the player's hand
@@ -88,6 +127,8 @@ class LetterBank:
     """
     Manages the letters available in the game
     """
+    __slots__ = ('distribution', 'values', 'distribution_total', 'bag_counts', 'bag_total', 'player_hand')
+    
     # Define LETTER_VALUES as a class attribute for easy access
     LETTER_VALUES = {
         'a': 1, 'b': 3, 'c': 3, 'd': 2, 'e': 1, 'f': 4, 'g': 2, 'h': 4, 'i': 1,
@@ -95,6 +136,14 @@ class LetterBank:
         's': 1, 't': 1, 'u': 1, 'v': 4, 'w': 4, 'x': 8, 'y': 4, 'z': 10, '0': 0
     }
 
+    # Default Scrabble-like distribution {letter: count}
+    DEFAULT_DISTRIBUTION = {
+        'a': 9, 'b': 2, 'c': 2, 'd': 4, 'e': 12, 'f': 2, 'g': 3, 'h': 2, 'i': 9,
+        'j': 1, 'k': 1, 'l': 4, 'm': 2, 'n': 6, 'o': 8, 'p': 2, 'q': 1, 'r': 6,
+        's': 4, 't': 6, 'u': 4, 'v': 2, 'w': 2, 'x': 1, 'y': 2, 'z': 1, '0': 2  # '0' represents blank tiles
+    }
+    _DEFAULT_TOTAL = sum(DEFAULT_DISTRIBUTION.values())
+
     def __init__(self, distribution=None, values=None):
         """
         Initialize the letter bank with a distribution of letters.
@@ -103,19 +152,14 @@ class LetterBank:
             distribution (dict): The distribution of letters {letter: count}
             values (dict): The point value of each letter {letter: points}
         """
-        # Default Scrabble-like distribution
-        self.distribution = distribution or {
-            'a': 9, 'b': 2, 'c': 2, 'd': 4, 'e': 12, 'f': 2, 'g': 3, 'h': 2, 'i': 9,
-            'j': 1, 'k': 1, 'l': 4, 'm': 2, 'n': 6, 'o': 8, 'p': 2, 'q': 1, 'r': 6,
-            's': 4, 't': 6, 'u': 4, 'v': 2, 'w': 2, 'x': 1, 'y': 2, 'z': 1, '0': 2  # '0' represents blank tiles
-        }
-        
-        # Default Scrabble-like letter values
-        self.values = values or {
-            'a': 1, 'b': 3, 'c': 3, 'd': 2, 'e': 1, 'f': 4, 'g': 2, 'h': 4, 'i': 1,
-            'j': 8, 'k': 5, 'l': 1, 'm': 3, 'n': 1, 'o': 1, 'p': 3, 'q': 10, 'r': 1,
-            's': 1, 't': 1, 'u': 1, 'v': 4, 'w': 4, 'x': 8, 'y': 4, 'z': 10, '0': 0  # Blank tiles are worth 0
-        }
+        # The shared class-level defaults are only read, never modified
+        self.distribution = distribution or self.DEFAULT_DISTRIBUTION
+        self.values = values or self.LETTER_VALUES
+        # Bag size after a reset; the default total is computed once for the class
+        if distribution:
+            self.distribution_total = sum(distribution.values())
+        else:
+            self.distribution_total = self._DEFAULT_TOTAL
         
         self.reset()
         
@@ -126,13 +170,9 @@ class LetterBank:
         """
         Reset the letter bank to its initial state
         """
-        # Initialize bag of letters based on distribution
-        self.bag = []
-        for letter, count in self.distribution.items():
-            self.bag.extend([letter] * count)
-        
-        # Shuffle the bag
-        random.shuffle(self.bag)
+        # The bag only stores how many of each letter are left
+        self.bag_counts = Counter(self.distribution)
+        self.bag_total = self.distribution_total
         
     def draw_letter(self):
         """
@@ -141,10 +181,15 @@ class LetterBank:
         Returns:
             str: A random letter, or None if the bag is empty
         """
-        if not self.bag:
+        if not self.bag_total:
             return None
         
-        return self.bag.pop()
+        # Weight each letter by how many of it are left in the bag
+        letters = list(self.bag_counts)
+        letter = random.choices(letters, weights=[self.bag_counts[l] for l in letters])[0]
+        self.bag_counts[letter] -= 1
+        self.bag_total -= 1
+        return letter
         
     def draw_letters(self, count):
         """
@@ -156,11 +201,16 @@ class LetterBank:
         Returns:
             list: The drawn letters
         """
-        letters = []
-        for _ in range(min(count, len(self.bag))):
-            letter = self.draw_letter()
-            if letter:
-                letters.append(letter)
+        count = min(count, self.bag_total)
+        if count <= 0:
+            return []
+            
+        # One sample without replacement over the letter counts
+        available = list(self.bag_counts)
+        letters = random.sample(available, count, counts=[self.bag_counts[l] for l in available])
+        for letter in letters:
+            self.bag_counts[letter] -= 1
+        self.bag_total -= count
         return letters
         
     def return_letter(self, letter):
@@ -170,8 +220,19 @@ class LetterBank:
         Args:
             letter (str): The letter to return
         """
-        self.bag.append(letter)
-        random.shuffle(self.bag)
+        self.bag_counts[letter] += 1
+        self.bag_total += 1
+        
+    def return_letters(self, letters):
+        """
+        Return several letters to the bag
+        
+        Args:
+            letters (iterable): The letters to return
+        """
+        letters = list(letters)
+        self.bag_counts.update(letters)
+        self.bag_total += len(letters)
         
     def get_letter_value(self, letter):
         """
@@ -192,7 +253,7 @@ class LetterBank:
         Returns:
             int: Count of letters remaining
         """
-        return len(self.bag)
+        return self.bag_total
         
     def letters_available(self):
         """
@@ -201,7 +262,7 @@ class LetterBank:
         Returns:
             bool: True if letters are available, False otherwise
         """
-        return len(self.bag) > 0
+        return self.bag_total > 0
         
     def get_available_letters(self):
         """
@@ -212,6 +273,18 @@ class LetterBank:
         """
         return self.player_hand.get_letters()
         
+    def has_letters(self, word):
+        """
+        Check if the player's hand has the letters needed for a word
+        
+        Args:
+            word (str): The word to check
+            
+        Returns:
+            bool: True if the word can be formed, False otherwise
+        """
+        return self.player_hand.can_form_word(word)
+        
     def add_letter(self, letter):
         """
         Add a letter back to the player's hand
@@ -6,30 +6,34 @@ Main entry point for the game
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication
 from board import Board
 from letter_bank import LetterBank
 from scoring import Scoring
-from word_validator import WordValidator
 
-# Ensure necessary databases exist before starting
-from database import create_database
-from merriam_webster_api import merriam_webster
+# Set once dictionary.db is known to exist, so repeat calls skip the filesystem check
+_DB_READY = False
 
 def initialize_databases():
     """Initialize required databases for the game"""
-    if not os.path.exists("dictionary.db"):
-        print("Setting up dictionary database for first run...")
-        create_database()
+    global _DB_READY
+    
+    # Imported here so importing main for Game does not pull these in
+    from database import create_database
+    from merriam_webster_api import merriam_webster
+    
+    if not _DB_READY:
+        try:
+            os.stat("dictionary.db")
+        except FileNotFoundError:
+            print("Setting up dictionary database for first run...")
+            create_database()
+        _DB_READY = True
     
     # Check for Merriam-Webster API key and notify user if missing
     if not merriam_webster.api_key:
         print("Note: Merriam-Webster API key not found. Set the MERRIAM_WEBSTER_API_KEY environment variable")
         print("      for enhanced word validation. Using local dictionary as fallback.")
 
-# Start the game
-from gui import WordMosaicApp
-
 # Define special tiles
 special_tiles = {
     (0, 0): 'TW', (0, 7): 'TW', (0, 14): 'TW',
@@ -50,22 +54,48 @@ special_tiles = {
     (12, 6): 'DL', (12, 8): 'DL', (14, 3): 'DL', (14, 11): 'DL',
 }
 
+# Point value of every ASCII character, indexed by its byte value
+_LETTER_VALUE_TABLE = bytes(LetterBank.LETTER_VALUES.get(chr(i).lower(), 0) for i in range(128))
+
 class Game:
     """Game logic for Word Mosaic"""
+    __slots__ = ('board', 'letter_bank', 'scoring', 'word_validator', 'score', 'played_words', '_played_set')
+    
     def __init__(self):
+        # Imported here so importing main does not load the Merriam-Webster client
+        from word_validator import WordValidator
+        
         self.board = Board(15, 15, special_tiles)
         self.letter_bank = LetterBank()
         self.scoring = Scoring(special_tiles, LetterBank.LETTER_VALUES)
         self.word_validator = WordValidator()
         self.score = 0
         self.played_words = []
+        self._played_set = set()  # Same words as played_words, for fast membership checks
         
     def new_game(self):
         """Reset the game to a new state"""
-        self.board.reset_board()
+        self.board.reset()  # Clear the existing board; the shared special_tiles layout is kept
         self.letter_bank = LetterBank()  # Get a fresh set of letters
         self.score = 0
         self.played_words = []
+        self._played_set = set()
+        
+    def add_played_word(self, word):
+        """
+        Record a word as played unless it was already played
+        
+        Args:
+            word (str): The word to record
+            
+        Returns:
+            bool: True if the word was added, False if it was already played
+        """
+        if word in self._played_set:
+            return False
+        self._played_set.add(word)
+        self.played_words.append(word)
+        return True
         
     def play_word(self, word):
         """
@@ -77,8 +107,12 @@ class Game:
         Returns:
             dict: Result containing validity and score info
         """
-        word = word.upper()
+        # Normalize once; the validator, letter bank and values all use lowercase
+        word = word.lower()
         
+        if word in self._played_set:
+            return {'valid': False, 'reason': 'Word has already been played'}
+            
         # First, check if word is valid
         if not self.word_validator.validate_word(word):
             return {'valid': False, 'reason': 'Not a valid dictionary word'}
@@ -87,15 +121,15 @@ class Game:
         if not self.letter_bank.has_letters(word):
             return {'valid': False, 'reason': 'Insufficient letters available'}
             
+        # Use every letter of the word from the player's hand
+        self.letter_bank.player_hand.remove_letters(word)
+        
         # TODO: Add logic for board placement
         # For now, just add to played words
-        self.played_words.append(word)
+        self.add_played_word(word)
         
         # Calculate score (placeholder)
-        word_score = sum(LetterBank.LETTER_VALUES.get(letter.lower(), 0) for letter in word)
-        
-        # Use letters from the letter bank
-        self.letter_bank.use_letters(word)
+        word_score = sum(_LETTER_VALUE_TABLE[byte] for byte in word.encode('ascii', 'ignore'))
         
         # Update total score
         self.score += word_score
@@ -104,8 +138,9 @@ class Game:
         
     def get_word_definition(self, word):
         """Get a definition for a word if available"""
-        # Check Merriam-Webster dictionary database first
-        definition = self.word_validator.get_definition_from_merriam_webster(word)
+        # Check Merriam-Webster first; definitions it fetches are stored in
+        # definitions.db, so repeat words never go back to the network
+        definition = self.word_validator.get_definition(word)
         if definition:
             return definition
 
@@ -134,6 +169,10 @@ def main():
     """
     Main entry point for the Word Mosaic game
     """
+    # Qt is only needed once the GUI actually starts
+    from PyQt5.QtWidgets import QApplication
+    from gui import WordMosaicApp
+    
     # Initialize the game
     game = Game()
     
@@ -4,11 +4,23 @@ Provides functions to fetch word definitions and validate words using the Merria
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote_plus
+import logging
 import os
+import random
+import re
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
+from database import configure_connection
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
@@ -18,15 +30,159 @@ COLLEGIATE = "collegiate"
 LEARNERS = "learners"
 
 # Export constants for external use
-__all__ = ["COLLEGIATE", "LEARNERS", "MerriamWebsterAPI", "merriam_webster"]
+__all__ = ["COLLEGIATE", "LEARNERS", "MerriamWebsterAPI", "get_merriam_webster", "merriam_webster"]
+
+# Queries run for every cache lookup or write; defining each once keeps the SQL
+# text identical so the connection's statement cache reuses the compiled form
+_SELECT_VALIDATION_SQL = "SELECT is_valid FROM merriam_webster_definitions WHERE word = ?"
+_SELECT_DEFINITION_SQL = "SELECT definition FROM merriam_webster_definitions WHERE word = ?"
+_INSERT_VALIDATION_SQL = "INSERT OR REPLACE INTO merriam_webster_definitions (word, is_valid) VALUES (?, ?)"
+_INSERT_DEFINITION_SQL = "INSERT OR REPLACE INTO merriam_webster_definitions (word, definition, is_valid) VALUES (?, ?, 1)"
+
+# Words the game accepts: 2 to 28 lowercase letters (word_validator shares this pattern)
+WORD_RE = re.compile(r'[a-z]{2,28}')
+
+# Functional labels marking an abbreviation entry ('abbr' also covers 'abbreviation')
+_ABBR_LABEL_RE = re.compile(r'abbr|acronym', re.IGNORECASE)
+# Definition text that mentions an abbreviation
+_DEF_ABBR_RE = re.compile(r'abbreviation|abbr\.|acronym', re.IGNORECASE)
+
+def _contains_abbr(node):
+    """
+    Check if any string in a parsed definition mentions an abbreviation or acronym
+    
+    Walks the nested lists and dicts directly and stops at the first match.
+    
+    Args:
+        node: Part of a Merriam-Webster definition (str, list, or dict)
+        
+    Returns:
+        bool: True if an abbreviation indicator was found, False otherwise
+    """
+    if isinstance(node, str):
+        return _DEF_ABBR_RE.search(node) is not None
+    if isinstance(node, list):
+        return any(_contains_abbr(item) for item in node)
+    if isinstance(node, dict):
+        return any(_contains_abbr(value) for value in node.values())
+    return False
+
+def _format_definition(data):
+    """
+    Format the short definitions of the first entry in an API response
+    
+    Args:
+        data: Parsed JSON response from the Merriam-Webster API
+        
+    Returns:
+        str or None: "part of speech: definitions", or None if the response has none
+    """
+    if data and isinstance(data, list) and isinstance(data[0], dict) and data[0].get('shortdef'):
+        # Join multiple definitions
+        definition = "; ".join(data[0]['shortdef'])
+        
+        # Get part of speech if available
+        part_of_speech = data[0].get('fl', '')
+        return f"{part_of_speech}: {definition}" if part_of_speech else definition
+    return None
+
+
+class LRUCache:
+    """
+    Thread-safe mapping that keeps at most maxsize entries, evicting the least
+    recently used one first
+    """
+    def __init__(self, maxsize=5000):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize (int): Maximum number of entries to keep
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Get a cached value and mark it as recently used
+        
+        Args:
+            key: The key to look up
+            default: Value returned when the key is not cached
+            
+        Returns:
+            The cached value, or default if not found
+        """
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
 
-# Dictionary of cached validation results to avoid repeated API calls
-cached_validations = {}
+# Cached validation results to avoid repeated API calls
+cached_validations = LRUCache(maxsize=5000)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that allows short bursts of requests while
+    keeping the average rate under a limit
+    """
+    def __init__(self, capacity=10, rate=5.0):
+        """
+        Initialize the token bucket
+        
+        Args:
+            capacity (int): Maximum number of requests that can be sent in a burst
+            rate (float): Tokens added back per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cost=1):
+        """
+        Take tokens from the bucket, sleeping until enough are available
+        
+        Args:
+            cost (int): Number of tokens the request uses
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            # Going negative reserves the tokens, so waiting callers queue up in order
+            self.tokens -= cost
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0
+            
+        if delay:
+            # A little jitter keeps waiting threads from firing together
+            time.sleep(delay + random.uniform(0, 0.05))
 
 class MerriamWebsterAPI:
     """
     Class to handle interactions with the Merriam-Webster Dictionary API
     """
+    __slots__ = ('dictionary_type', 'api_key', 'dictionary_url_part', 'name', 'base_url', '_url_suffix', '_info',
+                 '_session', '_rate_limiter', '_db', '_db_lock', '_valid_words', '_invalid_words',
+                 '_pending', '_pending_lock')
+    
     def __init__(self, api_key=None, dictionary_type=None):
         """
         Initialize the Merriam-Webster API client
@@ -61,36 +217,82 @@ class MerriamWebsterAPI:
             print(f"Set MERRIAM_WEBSTER_{self.dictionary_type}_API_KEY environment variable.")
         
         self.base_url = f"https://www.dictionaryapi.com/api/v3/references/{self.dictionary_url_part}/json/"
+        self._url_suffix = f"?key={quote_plus(self.api_key or '')}"
         
-        # Initialize the definitions database
-        self.create_definitions_database()
+        # Nothing here changes after construction, so the info dict is built once
+        self._info = {
+            'name': self.name,
+            'type': self.dictionary_type,
+            'api_available': bool(self.api_key),
+            'url_part': self.dictionary_url_part
+        }
+        
+        # Reuse one HTTP session so lookups share pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({"Accept-Encoding": "gzip"})
+        retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503])
+        self._session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retries))
+        
+        # Allow short bursts, such as a turn's words, while averaging 5 requests per second
+        self._rate_limiter = TokenBucket(capacity=10, rate=5.0)
+        
+        # Requests in flight, so concurrent lookups of one word share a single call
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        
+        # The definitions database is opened on first use, so importing this
+        # module or building a client never touches SQLite
+        self._db = None
+        self._db_lock = threading.RLock()
 
     def create_definitions_database(self):
         """
-        Create a SQLite database to store word definitions from Merriam-Webster
+        Open the SQLite database that stores word definitions from Merriam-Webster,
+        creating the table if needed
         """
         db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Create the definitions table if it doesn't exist
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS merriam_webster_definitions (
-                word TEXT PRIMARY KEY,
-                definition TEXT,
-                is_valid BOOLEAN,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        conn.commit()
-        conn.close()
-
-    def is_valid_word(self, word):
+        
+        # The lock serializes the validate_words worker threads that share the connection
+        with self._db_lock:
+            # One connection is kept for the life of the client
+            db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            configure_connection(db)
+            db.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+            db.execute("PRAGMA temp_store=MEMORY")
+            
+            # Create the definitions table if it doesn't exist
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS merriam_webster_definitions (
+                    word TEXT PRIMARY KEY,
+                    definition TEXT,
+                    is_valid BOOLEAN,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Load every stored verdict up front so cache hits are set lookups
+            rows = db.execute("SELECT word, is_valid FROM merriam_webster_definitions").fetchall()
+            self._valid_words = {word for word, is_valid in rows if is_valid}
+            self._invalid_words = {word for word, is_valid in rows if not is_valid}
+            
+            # Set last, so other threads never see a half-loaded database
+            self._db = db
+
+    def _ensure_db(self):
+        """Open the definitions database if this client hasn't yet"""
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    self.create_definitions_database()
+
+    def is_valid_word(self, word, writes=None):
         """
         Check if a word exists in the Merriam-Webster dictionary and is not an abbreviation
         
         Args:
             word (str): The word to validate
+            writes (list, optional): Collects (word, is_valid, definition) results to store
+                later instead of writing each one to the database immediately
             
         Returns:
             bool: True if the word is valid and not an abbreviation, False otherwise
@@ -98,36 +300,77 @@ class MerriamWebsterAPI:
         # Convert to lowercase for consistency
         word = word.lower().strip()
         
-        print(f"[DEBUG MW API] Checking if '{word}' is valid")
+        logger.debug("Checking if '%s' is valid", word)
+        
+        # Malformed input can never be a dictionary entry, so don't spend a lookup on it
+        if not WORD_RE.fullmatch(word):
+            logger.debug("Rejected malformed word '%s'", word)
+            return False
         
         # Return from cache if available
-        if word in cached_validations:
-            print(f"[DEBUG MW API] Found '{word}' in cache: {cached_validations[word]}")
-            return cached_validations[word]
+        is_valid = cached_validations.get(word)
+        if is_valid is not None:
+            logger.debug("Found '%s' in cache: %s", word, is_valid)
+            return is_valid
         
         # First, try the local SQLite database for cached validation
         is_valid = self._get_cached_validation(word)
         if is_valid is not None:
-            print(f"[DEBUG MW API] Found '{word}' in local DB cache: {is_valid}")
+            logger.debug("Found '%s' in local DB cache: %s", word, is_valid)
             cached_validations[word] = is_valid
             return is_valid
         
         # If not in local cache, try Merriam-Webster API
         if not self.api_key:
             # No API key available, return None to indicate fallback needed
-            print(f"[DEBUG MW API] No API key for '{word}', returning None")
+            logger.debug("No API key for '%s', returning None", word)
             return None
             
+        # If another thread is already requesting this word, wait for its answer
+        with self._pending_lock:
+            future = self._pending.get(word)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._pending[word] = future
+        if not is_owner:
+            return future.result()
+            
         try:
-            url = f"{self.base_url}{quote_plus(word)}?key={self.api_key}"
-            print(f"[DEBUG MW API] Requesting URL for '{word}': {url}")
-            response = requests.get(url, timeout=5)
+            is_valid = self._request_validation(word, writes)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(is_valid)
+            return is_valid
+        finally:
+            with self._pending_lock:
+                del self._pending[word]
+
+    def _request_validation(self, word, writes=None):
+        """
+        Ask the Merriam-Webster API whether a word is valid and cache the answer
+        
+        Args:
+            word (str): The lowercased word to validate
+            writes (list, optional): Collects the result to store instead of writing it now
+            
+        Returns:
+            bool or None: True if valid, False if invalid, None if the request failed
+        """
+        try:
+            url = self._word_url(word)
+            logger.debug("Requesting URL for '%s': %s", word, url)
+            self._rate_limiter.acquire()
+            response = self._session.get(url, timeout=5)
             
-            print(f"[DEBUG MW API] Response status for '{word}': {response.status_code}")
+            logger.debug("Response status for '%s': %s", word, response.status_code)
             
             if response.status_code == 200:
                 data = response.json()
-                print(f"[DEBUG MW API] Response data type: {type(data)}, length: {len(data) if isinstance(data, list) else 'N/A'}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response data type: %s, length: %s", type(data), len(data) if isinstance(data, list) else 'N/A')
                 
                 # Check if we got a valid dictionary entry (not just suggestions)
                 has_valid_definition = False
@@ -136,16 +379,14 @@ class MerriamWebsterAPI:
                 if data and isinstance(data, list):
                     for entry in data:
                         if isinstance(entry, dict) and 'meta' in entry:
-                            print(f"[DEBUG MW API] Found dictionary entry with meta for '{word}'")
+                            logger.debug("Found dictionary entry with meta for '%s'", word)
                             # Check if this entry is an abbreviation
                             functional_label = entry.get('fl', '').lower()
                             
-                            print(f"[DEBUG MW API] Functional label for '{word}': {functional_label}")
+                            logger.debug("Functional label for '%s': %s", word, functional_label)
                             
                             # Check if this is a valid non-abbreviation definition
-                            is_abbreviation_entry = ('abbr' in functional_label or 
-                                'abbreviation' in functional_label or
-                                'acronym' in functional_label)
+                            is_abbreviation_entry = _ABBR_LABEL_RE.search(functional_label) is not None
                             
                             # If we find at least one non-abbreviation entry, set flag
                             if not is_abbreviation_entry:
@@ -153,50 +394,86 @@ class MerriamWebsterAPI:
                                 
                                 # Also check definitions for abbreviation indicators
                                 if 'def' in entry:
-                                    definition_text = json.dumps(entry['def']).lower()
-                                    print(f"[DEBUG MW API] Definition contains abbreviation indicators? {'yes' if ('abbreviation' in definition_text or 'abbr.' in definition_text or 'acronym' in definition_text) else 'no'}")
-                                    if ('abbreviation' in definition_text or
-                                        'abbr.' in definition_text or
-                                        'acronym' in definition_text):
+                                    mentions_abbreviation = _contains_abbr(entry['def'])
+                                    logger.debug("Definition contains abbreviation indicators? %s", 'yes' if mentions_abbreviation else 'no')
+                                    if mentions_abbreviation:
                                         # Skip this definition if it mentions abbreviation
                                         continue
                                 
                                 # Mark as valid if we found a non-abbreviation definition
                                 has_valid_definition = True
-                                print(f"[DEBUG MW API] Found valid non-abbreviation definition for '{word}'")
+                                logger.debug("Found valid non-abbreviation definition for '%s'", word)
                         
                     # If no dictionary entries found, it's not a valid word
                     if not has_valid_definition:
-                        print(f"[DEBUG MW API] No valid definitions found for '{word}'")
+                        logger.debug("No valid definitions found for '%s'", word)
                         is_valid = False
                     elif all_entries_are_abbreviations:
                         # If all entries are abbreviations, mark as invalid
-                        print(f"[DEBUG MW API] '{word}' only has abbreviation definitions")
+                        logger.debug("'%s' only has abbreviation definitions", word)
                         is_valid = False
                     else:
                         # Word has at least one valid non-abbreviation definition
-                        print(f"[DEBUG MW API] '{word}' has valid non-abbreviation definitions")
+                        logger.debug("'%s' has valid non-abbreviation definitions", word)
                         is_valid = True
                 else:
-                    print(f"[DEBUG MW API] Received suggestions or empty response for '{word}'")
+                    logger.debug("Received suggestions or empty response for '%s'", word)
                     is_valid = False
                 
-                print(f"[DEBUG MW API] Final validation result for '{word}': {is_valid}")
+                logger.debug("Final validation result for '%s': %s", word, is_valid)
                 
-                # Cache the validation result
-                self._cache_validation(word, is_valid)
+                # Cache the validation result, along with the definition this response already
+                # carries so fetch_definition can answer from the database without another request
+                definition = _format_definition(data) if is_valid else None
+                if writes is not None:
+                    writes.append((word, is_valid, definition))
+                elif definition:
+                    self._cache_definition(word, definition)
+                else:
+                    self._cache_validation(word, is_valid)
                 cached_validations[word] = is_valid
                 return is_valid
             
             # API call failed
-            print(f"[DEBUG MW API] API call failed for '{word}' with status code {response.status_code}")
+            logger.debug("API call failed for '%s' with status code %s", word, response.status_code)
             return None
             
         except Exception as e:
             # Handle any errors (timeout, connection issues, etc.)
-            print(f"[DEBUG MW API] Error for '{word}': {str(e)}")
+            logger.debug("Error for '%s': %s", word, e)
             return None
 
+    def validate_words(self, words, max_workers=5):
+        """
+        Check several words at once, running the lookups concurrently
+        
+        Args:
+            words (list): The words to validate
+            max_workers (int): Maximum number of lookups in flight at once
+            
+        Returns:
+            dict: {word: result} keyed by the lowercased word, where each result is
+                  the same True/False/None that is_valid_word returns
+        """
+        # Each distinct word is only looked up once, and cached words not at all
+        results = {}
+        misses = []
+        for word in dict.fromkeys(word.lower().strip() for word in words):
+            is_valid = cached_validations.get(word)
+            if is_valid is not None:
+                results[word] = is_valid
+            else:
+                misses.append(word)
+                
+        if misses:
+            # New verdicts are gathered and stored together in a single transaction
+            writes = []
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as executor:
+                results.update(zip(misses, executor.map(lambda word: self.is_valid_word(word, writes), misses)))
+            if writes:
+                self.cache_validations_bulk(writes)
+        return results
+
     def fetch_definition(self, word):
         """
         Fetch definition for a word from Merriam-Webster dictionary
@@ -220,27 +497,19 @@ class MerriamWebsterAPI:
             return None
             
         try:
-            url = f"{self.base_url}{quote_plus(word)}?key={self.api_key}"
-            response = requests.get(url, timeout=5)
+            url = self._word_url(word)
+            self._rate_limiter.acquire()
+            response = self._session.get(url, timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
                 
                 # Process the dictionary data
-                if data and isinstance(data, list) and len(data) > 0 and isinstance(data[0], dict) and 'shortdef' in data[0]:
-                    # Get the first definition
-                    definitions = data[0]['shortdef']
-                    if definitions:
-                        # Join multiple definitions
-                        definition = "; ".join(definitions)
-                        
-                        # Get part of speech if available
-                        part_of_speech = data[0].get('fl', '')
-                        formatted_def = f"{part_of_speech}: {definition}" if part_of_speech else definition
-                        
-                        # Cache the definition locally
-                        self._cache_definition(word, formatted_def)
-                        return formatted_def
+                formatted_def = _format_definition(data)
+                if formatted_def:
+                    # Cache the definition locally
+                    self._cache_definition(word, formatted_def)
+                    return formatted_def
             
             # API failed or no definition found
             return None
@@ -250,6 +519,21 @@ class MerriamWebsterAPI:
             print(f"Merriam-Webster API error for definition of '{word}': {str(e)}")
             return None
 
+    def _word_url(self, word):
+        """
+        Build the API URL for a word
+        
+        Args:
+            word (str): The word to look up
+            
+        Returns:
+            str: The request URL
+        """
+        # Plain words need no escaping, which covers nearly every lookup
+        if word.isalpha() and word.isascii():
+            return self.base_url + word + self._url_suffix
+        return self.base_url + quote_plus(word) + self._url_suffix
+
     def _get_cached_validation(self, word):
         """
         Get cached validation result from SQLite database
@@ -261,13 +545,15 @@ class MerriamWebsterAPI:
             bool or None: True if valid, False if invalid, None if not cached
         """
         try:
-            db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT is_valid FROM merriam_webster_definitions WHERE word = ?", (word,))
-            result = cursor.fetchone()
-            conn.close()
+            self._ensure_db()
+            if word in self._valid_words:
+                return True
+            if word in self._invalid_words:
+                return False
+                
+            # Fall back to the database for rows written by another client since startup
+            with self._db_lock:
+                result = self._db.execute(_SELECT_VALIDATION_SQL, (word,)).fetchone()
             
             if result is not None:
                 return bool(result[0])
@@ -286,13 +572,9 @@ class MerriamWebsterAPI:
             str or None: Definition if found, None otherwise
         """
         try:
-            db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT definition FROM merriam_webster_definitions WHERE word = ?", (word,))
-            result = cursor.fetchone()
-            conn.close()
+            self._ensure_db()
+            with self._db_lock:
+                result = self._db.execute(_SELECT_DEFINITION_SQL, (word,)).fetchone()
             
             if result:
                 return result[0]
@@ -308,19 +590,33 @@ class MerriamWebsterAPI:
             word (str): The word to cache
             is_valid (bool): Whether the word is valid
         """
+        self.cache_validations_bulk([(word, is_valid, None)])
+
+    def cache_validations_bulk(self, results):
+        """
+        Cache several validation results in one transaction
+        
+        Args:
+            results (list): (word, is_valid, definition) tuples to store, where
+                definition may be None
+        """
+        results = list(results)
         try:
-            db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Insert or replace the validation result
-            cursor.execute("""
-                INSERT OR REPLACE INTO merriam_webster_definitions (word, is_valid)
-                VALUES (?, ?)
-            """, (word, is_valid))
-            
-            conn.commit()
-            conn.close()
+            self._ensure_db()
+            with self._db_lock:
+                self._db.execute("BEGIN")
+                try:
+                    # Insert or replace the validation results, with definitions where known
+                    self._db.executemany(_INSERT_VALIDATION_SQL,
+                                         [(word, is_valid) for word, is_valid, definition in results if not definition])
+                    self._db.executemany(_INSERT_DEFINITION_SQL,
+                                         [(word, definition) for word, _, definition in results if definition])
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+            for word, is_valid, _ in results:
+                self._remember_validation(word, is_valid)
         except Exception as e:
             print(f"Error caching validation: {e}")
 
@@ -333,21 +629,37 @@ class MerriamWebsterAPI:
             definition (str): The definition to cache
         """
         try:
-            db_path = os.path.join(os.path.dirname(__file__), "definitions.db")
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Insert or replace the definition
-            cursor.execute("""
-                INSERT OR REPLACE INTO merriam_webster_definitions (word, definition, is_valid)
-                VALUES (?, ?, 1)
-            """, (word, definition))
-            
-            conn.commit()
-            conn.close()
+            self._ensure_db()
+            with self._db_lock:
+                # Insert or replace the definition
+                self._db.execute(_INSERT_DEFINITION_SQL, (word, definition))
+            self._remember_validation(word, True)
         except Exception as e:
             print(f"Error caching definition: {e}")
 
+    def _remember_validation(self, word, is_valid):
+        """
+        Record a stored validation result in the preloaded word sets
+        
+        Args:
+            word (str): The word that was stored
+            is_valid (bool): Whether the word is valid
+        """
+        if is_valid:
+            self._invalid_words.discard(word)
+            self._valid_words.add(word)
+        else:
+            self._valid_words.discard(word)
+            self._invalid_words.add(word)
+
+    def close(self):
+        """Close the HTTP session and the definitions database connection"""
+        self._session.close()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
     def get_dictionary_info(self):
         """
         Get information about the current dictionary
@@ -355,23 +667,28 @@ class MerriamWebsterAPI:
         Returns:
             dict: Dictionary information including name, API availability, and dictionary type
         """
-        # Set the dictionary display name based on type
-        if self.dictionary_url_part == "collegiate":
-            name = "Merriam-Webster's Collegiate® Dictionary"
-        elif self.dictionary_url_part == "learners":
-            name = "Merriam-Webster's Learner's Dictionary"
-        else:
-            name = f"Merriam-Webster {self.dictionary_url_part.capitalize()}"
-            
-        # Build the information dictionary
-        info = {
-            'name': name,
-            'type': self.dictionary_type,
-            'api_available': bool(self.api_key),
-            'url_part': self.dictionary_url_part
-        }
-            
-        return info
+        return self._info
+
+def get_merriam_webster(dictionary_type=None):
+    """
+    Get the shared client for a dictionary type
+    
+    Repeat calls for the same type return the same instance, so they share
+    one HTTP session.
+    
+    Args:
+        dictionary_type (str): The dictionary to use (collegiate or learners), or None for the default
+        
+    Returns:
+        MerriamWebsterAPI: The client for that dictionary
+    """
+    dictionary_type = dictionary_type or os.environ.get('DEFAULT_DICTIONARY', 'COLLEGIATE')
+    return _create_client(dictionary_type.upper())
+
+@lru_cache(maxsize=None)
+def _create_client(dictionary_type):
+    """Create the client for a normalized dictionary type (called once per type)"""
+    return MerriamWebsterAPI(dictionary_type=dictionary_type)
 
 # Create a global instance with default settings
-merriam_webster = MerriamWebsterAPI()
\ No newline at end of file
+merriam_webster = get_merriam_webster()
\ No newline at end of file
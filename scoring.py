@@ -1,4 +1,8 @@
 class Scoring:
+    # Multipliers for each special tile type
+    LETTER_MULTIPLIERS = {'DL': 2, 'TL': 3}  # Double / Triple Letter
+    WORD_MULTIPLIERS = {'DW': 2, 'TW': 3}  # Double / Triple Word
+
     def __init__(self, special_tiles, letter_scores):
         """
         Initialize the Scoring class with special tile information and letter scores.
@@ -9,6 +13,7 @@ class Scoring:
         """
         self.special_tiles = special_tiles  # Special tile information (e.g., TW, DW, TL, DL)
         self.letter_scores = letter_scores  # Letter scores for scoring
+        self._build_letter_lookup()
         self.total_score = 0  # Total score accumulated by the player
         self.bingo_bonus = 50  # Bonus score for using all 7 tiles in a single turn
         self.word_scores = {}  # Dictionary to store scores of individual words formed during a turn
@@ -51,17 +56,11 @@ class Scoring:
             letter_score = self.get_letter_score(letter)
             print(f"Processing letter: {letter}, position: {position}, letter_score: {letter_score}")  # Debugging statement
 
-            # Check if the position has a special tile
-            if position in self.special_tiles:
-                special_tile = self.special_tiles[position]
-                if special_tile == 'DL':  # Double Letter
-                    letter_score *= 2
-                elif special_tile == 'TL':  # Triple Letter
-                    letter_score *= 3
-                elif special_tile == 'DW':  # Double Word
-                    word_multiplier *= 2
-                elif special_tile == 'TW':  # Triple Word
-                    word_multiplier *= 3
+            # Apply the special tile at this position, if any
+            special_tile = self.special_tiles.get(position)
+            if special_tile:
+                letter_score *= self.LETTER_MULTIPLIERS.get(special_tile, 1)
+                word_multiplier *= self.WORD_MULTIPLIERS.get(special_tile, 1)
 
             word_score += letter_score
 
@@ -161,8 +160,18 @@ class Scoring:
         Returns:
             int: The score of the letter.
         """
-        print(f"Getting score for letter: {letter}")  # Debugging statement
-        return self.letter_scores.get(letter.lower(), 0)  # Default to 0 if the letter is not found
+        return self._letter_lookup.get(letter, 0)  # Default to 0 if the letter is not found
+
+    def _build_letter_lookup(self):
+        """
+        Build a lookup of letter scores under both cases, so scoring a letter is a
+        single dictionary probe with no per-letter lower() call.
+        """
+        self._letter_lookup = {}
+        for letter, score in self.letter_scores.items():
+            self._letter_lookup[letter.upper()] = score
+        for letter, score in self.letter_scores.items():
+            self._letter_lookup[letter.lower()] = score
 
 
     def apply_special_tiles(self, word, positions):
@@ -183,17 +192,11 @@ class Scoring:
             position = positions[i]
             letter_score = self.get_letter_score(letter)
 
-            # Check if the position has a special tile
-            if position in self.special_tiles:
-                special_tile = self.special_tiles[position]
-                if special_tile == 'DL':  # Double Letter
-                    letter_score *= 2
-                elif special_tile == 'TL':  # Triple Letter
-                    letter_score *= 3
-                elif special_tile == 'DW':  # Double Word
-                    word_multiplier *= 2
-                elif special_tile == 'TW':  # Triple Word
-                    word_multiplier *= 3
+            # Apply the special tile at this position, if any
+            special_tile = self.special_tiles.get(position)
+            if special_tile:
+                letter_score *= self.LETTER_MULTIPLIERS.get(special_tile, 1)
+                word_multiplier *= self.WORD_MULTIPLIERS.get(special_tile, 1)
 
             word_score += letter_score
 
@@ -244,6 +247,7 @@ class Scoring:
         import json
         with open(letter_score_file, "r") as file:
             self.letter_scores = json.load(file)
+        self._build_letter_lookup()
 
 
     def validate_word_positions(self, word, positions):
@@ -1,5 +1,17 @@
 import sqlite3
-from merriam_webster_api import merriam_webster, MerriamWebsterAPI
+import threading
+from merriam_webster_api import WORD_RE, get_merriam_webster
+
+# Common English words used when no dictionary database is available
+_COMMON_WORDS = frozenset((
+    "the", "be", "to", "of", "and", "a", "in", "that", "have", "it",
+    "for", "not", "on", "with", "he", "as", "you", "do", "at", "this",
+    "but", "his", "by", "from", "they", "we", "say", "her", "she", "or",
+    "an", "will", "my", "one", "all", "would", "there", "their", "what",
+    "so", "up", "out", "if", "about", "who", "get", "which", "go", "me",
+    "game", "play", "word", "letter", "score", "board", "tiles", "win",
+    "dare", "date", "data", "dark", "dash", "darn", "dart"  # Added additional common d-words
+))
 
 class WordValidator:
     """
@@ -14,14 +26,17 @@ class WordValidator:
             dictionary_type (str, optional): Type of dictionary to use (COLLEGIATE or LEARNERS)
             db_path (str, optional): Path to SQLite dictionary database for fallback
         """
-        # Initialize the Merriam-Webster API client with the specified dictionary type
-        self.mw_api = MerriamWebsterAPI(dictionary_type)
+        # Get the Merriam-Webster API client for the specified dictionary type
+        self.mw_api = get_merriam_webster(dictionary_type)
         self.dictionary_type = self.mw_api.dictionary_type
         self.dictionary_name = self.mw_api.name
         
-        # Also maintain the SQLite connection as fallback
+        # Also maintain the SQLite connection as fallback. The GUI validates words on a
+        # worker thread while the GUI thread may also query, so every use of the shared
+        # cursor is serialized by this lock (check_same_thread=False only disables sqlite's guard)
+        self._lock = threading.RLock()
         try:
-            self.conn = sqlite3.connect(db_path)
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
             self.cursor = self.conn.cursor()
             # Test if the dictionary table exists
             self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='dictionary'")
@@ -35,21 +50,12 @@ class WordValidator:
     def _create_fallback_dictionary(self):
         """Create an in-memory fallback dictionary with common English words"""
         print("Creating fallback in-memory dictionary")
-        self.conn = sqlite3.connect(":memory:")
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
         self.cursor = self.conn.cursor()
         self.cursor.execute("CREATE TABLE dictionary (word TEXT PRIMARY KEY, definition TEXT)")
         
         # Add some common English words as fallback
-        common_words = [
-            "the", "be", "to", "of", "and", "a", "in", "that", "have", "it",
-            "for", "not", "on", "with", "he", "as", "you", "do", "at", "this",
-            "but", "his", "by", "from", "they", "we", "say", "her", "she", "or",
-            "an", "will", "my", "one", "all", "would", "there", "their", "what",
-            "so", "up", "out", "if", "about", "who", "get", "which", "go", "me",
-            "game", "play", "word", "letter", "score", "board", "tiles", "win",
-            "dare", "date", "data", "dark", "dash", "darn", "dart"  # Added additional common d-words
-        ]
-        self.cursor.executemany("INSERT INTO dictionary (word) VALUES (?)", [(w,) for w in common_words])
+        self.cursor.executemany("INSERT INTO dictionary (word) VALUES (?)", [(w,) for w in _COMMON_WORDS])
         self.conn.commit()
 
     def validate_word(self, word):
@@ -64,8 +70,12 @@ class WordValidator:
         """
         print(f"[DEBUG VALIDATOR] Validating word: '{word}'")
         
+        # Reject malformed input (non-letters, 1 letter, longer than 28) before any lookup
+        if not WORD_RE.fullmatch(word.lower().strip()):
+            return False
+        
         # First try Merriam-Webster API
-        api_result = merriam_webster.is_valid_word(word.lower())
+        api_result = self.mw_api.is_valid_word(word.lower())
         print(f"[DEBUG VALIDATOR] Merriam-Webster API result for '{word}': {api_result}")
         
         # If API provides a definite answer, return it
@@ -73,8 +83,21 @@ class WordValidator:
             return api_result
         
         # Fallback to local database
-        self.cursor.execute("SELECT 1 FROM dictionary WHERE word = ?", (word.lower(),))
-        db_result = self.cursor.fetchone() is not None
+        return self._validate_locally(word)
+        
+    def _validate_locally(self, word):
+        """
+        Check if a word is in the local SQLite dictionary.
+
+        Args:
+            word (str): The word to validate
+
+        Returns:
+            bool: True if the word is in the local dictionary, False otherwise
+        """
+        with self._lock:
+            self.cursor.execute("SELECT 1 FROM dictionary WHERE word = ?", (word.lower(),))
+            db_result = self.cursor.fetchone() is not None
         print(f"[DEBUG VALIDATOR] Local dictionary result for '{word}': {db_result}")
         
         return db_result
@@ -89,7 +112,20 @@ class WordValidator:
         Returns:
             list: List of valid words
         """
-        return [word for word in words if self.validate_word(word)]
+        # Malformed words never reach the dictionary lookups
+        words = [word for word in words if WORD_RE.fullmatch(word.lower().strip())]
+        
+        # Merriam-Webster lookups for all the words run concurrently
+        api_results = self.mw_api.validate_words(words)
+        
+        valid_words = []
+        for word in words:
+            api_result = api_results[word.lower().strip()]
+            if api_result is None:
+                api_result = self._validate_locally(word)
+            if api_result:
+                valid_words.append(word)
+        return valid_words
 
     def suggest_words(self, word, max_suggestions=5):
         """
@@ -105,8 +141,9 @@ class WordValidator:
         from difflib import get_close_matches
 
         # Fetch all words from the database
-        self.cursor.execute("SELECT word FROM dictionary")
-        all_words = [row[0] for row in self.cursor.fetchall()]
+        with self._lock:
+            self.cursor.execute("SELECT word FROM dictionary")
+            all_words = [row[0] for row in self.cursor.fetchall()]
 
         return get_close_matches(word.lower(), all_words, n=max_suggestions)
 
@@ -121,7 +158,7 @@ class WordValidator:
             str: The definition of the word, or None if not found
         """
         # Try to get definition from Merriam-Webster API
-        return self.mw_api.get_definition(word)
+        return self.mw_api.fetch_definition(word)
 
     def get_definition_from_local(self, word):
         """
@@ -134,8 +171,9 @@ class WordValidator:
             str: The definition if found, or None if not found.
         """
         try:
-            self.cursor.execute("SELECT definition FROM dictionary WHERE word = ?", (word.lower(),))
-            result = self.cursor.fetchone()
+            with self._lock:
+                self.cursor.execute("SELECT definition FROM dictionary WHERE word = ?", (word.lower(),))
+                result = self.cursor.fetchone()
             if result:
                 return result[0]
         except sqlite3.Error as e:
@@ -153,8 +191,9 @@ class WordValidator:
             str: The definition if found, or None if not found.
         """
         try:
-            self.cursor.execute("SELECT definition FROM dictionary WHERE word = ?", (word.lower(),))
-            result = self.cursor.fetchone()
+            with self._lock:
+                self.cursor.execute("SELECT definition FROM dictionary WHERE word = ?", (word.lower(),))
+                result = self.cursor.fetchone()
             if result:
                 return result[0]
         except sqlite3.Error as e:
@@ -170,8 +209,9 @@ class WordValidator:
             definition (str): The definition of the word.
         """
         try:
-            self.cursor.execute("INSERT OR REPLACE INTO dictionary (word, definition) VALUES (?, ?)", (word.lower(), definition))
-            self.conn.commit()
+            with self._lock:
+                self.cursor.execute("INSERT OR REPLACE INTO dictionary (word, definition) VALUES (?, ?)", (word.lower(), definition))
+                self.conn.commit()
         except sqlite3.Error as e:
             print(f"SQLite error while adding word to database: {e}")
 
@@ -182,8 +222,9 @@ class WordValidator:
         Returns:
             int: The number of words in the dictionary.
         """
-        self.cursor.execute("SELECT COUNT(*) FROM dictionary")
-        return self.cursor.fetchone()[0]
+        with self._lock:
+            self.cursor.execute("SELECT COUNT(*) FROM dictionary")
+            return self.cursor.fetchone()[0]
     
     def switch_dictionary(self, dictionary_type):
         """
@@ -195,7 +236,7 @@ class WordValidator:
         Returns:
             dict: Information about the new dictionary
         """
-        self.mw_api = MerriamWebsterAPI(dictionary_type)
+        self.mw_api = get_merriam_webster(dictionary_type)
         self.dictionary_type = self.mw_api.dictionary_type
         self.dictionary_name = self.mw_api.name
         return self.mw_api.get_dictionary_info()
@@ -216,8 +257,9 @@ class WordValidator:
         
         # Get the count of words in the local database
         try:
-            self.cursor.execute("SELECT COUNT(*) FROM dictionary")
-            info['db_word_count'] = self.cursor.fetchone()[0]
+            with self._lock:
+                self.cursor.execute("SELECT COUNT(*) FROM dictionary")
+                info['db_word_count'] = self.cursor.fetchone()[0]
         except (sqlite3.Error, AttributeError):
             info['db_word_count'] = 0
             
@@ -225,4 +267,5 @@ class WordValidator:
 
     def close(self):
         """Close the database connection."""
-        self.conn.close()
\ No newline at end of file
+        with self._lock:
+            self.conn.close()
\ No newline at end of file